@@ -0,0 +1,145 @@
+"""
+Single command-line entry point for the IPL stats pipeline.
+
+    python cli.py scrape --start 2024 --end 2025
+    python cli.py load all_teams_2008_2024_stats.csv
+    python cli.py clean --input ipl_team_stats.csv
+    python cli.py export --output stats.csv --start-year 2024
+    python cli.py archive --cutoff 2018
+    python cli.py startup
+
+Only argparse and the stdlib are imported up front. Selenium, pandas,
+scikit-learn and Django are imported inside the subcommand that needs
+them, so `--help` and light subcommands start instantly.
+"""
+
+import argparse
+import os
+import sys
+
+# `python cli.py --help` must stay under this many seconds (see `startup`).
+STARTUP_BUDGET_SECONDS = 0.3
+
+
+def _setup_django():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ipl_scraper.settings")
+    import django
+    django.setup()
+
+
+def cmd_scrape(args):
+    import logging
+    import ipl
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    team_names = args.team or ipl.teams
+    ipl.main(range(args.start, args.end + 1), team_names)
+
+
+def cmd_load(args):
+    import csv
+
+    _setup_django()
+    from stats.utils import save_stats_batch
+
+    with open(args.path, newline="", encoding="utf-8") as fh:
+        records = list(csv.DictReader(fh))
+    save_stats_batch(records)
+    print(f"Loaded {len(records)} records from {args.path}")
+
+
+def cmd_clean(args):
+    import data_processing
+
+    data_processing.main(args.input, args.clean_output, args.features_output)
+
+
+def cmd_export(args):
+    _setup_django()
+    from stats.export import export_queryset, stream_export
+
+    qs = export_queryset(args.start_year, args.end_year, args.team, args.role)
+    with open(args.output, "wb") as fh:
+        for chunk in stream_export(qs, args.format, args.gzip):
+            fh.write(chunk)
+    print(f"Exported to {args.output}")
+
+
+def cmd_archive(args):
+    _setup_django()
+    from django.core.management import call_command
+
+    options = {"cutoff": args.cutoff, "delete": args.delete}
+    if args.output:
+        options["output"] = args.output
+    call_command("archive_stats", **options)
+
+
+def cmd_startup(args):
+    import statistics
+    import subprocess
+    import time
+
+    timings = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.abspath(__file__), "--help"],
+                       check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    median = statistics.median(timings)
+    print(f"`cli.py --help` median {median * 1000:.1f} ms over {args.runs} runs "
+          f"(budget {STARTUP_BUDGET_SECONDS * 1000:.0f} ms)")
+    if median > STARTUP_BUDGET_SECONDS:
+        sys.exit(1)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cli.py", description="IPL stats pipeline")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("scrape", help="Scrape iplt20stats.com and save to the database")
+    p.add_argument("--start", type=int, default=2008, help="First season (default 2008)")
+    p.add_argument("--end", type=int, default=2025, help="Last season (default 2025)")
+    p.add_argument("--team", action="append", help="Team key from ipl.teams (repeatable)")
+    p.set_defaults(func=cmd_scrape)
+
+    p = sub.add_parser("load", help="Load a scraped stats CSV into the database")
+    p.add_argument("path", help="CSV with Year, Team, Player, ... headers")
+    p.set_defaults(func=cmd_load)
+
+    p = sub.add_parser("clean", help="Run the team stats cleaning/feature pipeline")
+    p.add_argument("--input", default="ipl_team_stats.csv")
+    p.add_argument("--clean-output", default="ipl_team_stats_cleaned.csv")
+    p.add_argument("--features-output", default="ipl_team_features.csv")
+    p.set_defaults(func=cmd_clean)
+
+    p = sub.add_parser("export", help="Stream player-season stats from the database to CSV/NDJSON")
+    p.add_argument("--output", default="ipl_stats_export.csv")
+    p.add_argument("--format", choices=("csv", "ndjson"), default="csv")
+    p.add_argument("--start-year", type=int)
+    p.add_argument("--end-year", type=int)
+    p.add_argument("--team")
+    p.add_argument("--role")
+    p.add_argument("--gzip", action="store_true", help="Gzip the output")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("archive", help="Archive old seasons to a gzipped CSV")
+    p.add_argument("--cutoff", type=int, default=2018, help="Last season to archive (default 2018)")
+    p.add_argument("--output", help="Archive file (default: ipl_stats_upto_<cutoff>.csv.gz)")
+    p.add_argument("--delete", action="store_true", help="Delete archived rows afterwards")
+    p.set_defaults(func=cmd_archive)
+
+    p = sub.add_parser("startup", help="Check `--help` startup time against the budget")
+    p.add_argument("--runs", type=int, default=5)
+    p.set_defaults(func=cmd_startup)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
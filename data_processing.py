@@ -9,7 +9,12 @@ from datetime import datetime
 
 # — 1. Load raw data —
 RAW_PATH = "ipl_team_stats.csv"
-df_raw = pd.read_csv(r"C:\Users\Madv6\ipl_scraper\ipl_team_stats.csv")
+CLEAN_PATH = "ipl_team_stats_cleaned.csv"
+FEATURES_PATH = "ipl_team_features.csv"
+
+def load_raw(path: str = RAW_PATH) -> pd.DataFrame:
+    """Read the raw team stats CSV."""
+    return pd.read_csv(path)
 
 # — 2. Define cleaning functions —
 def drop_duplicates(df: pd.DataFrame) -> pd.DataFrame:
@@ -31,17 +36,19 @@ def enforce_dtypes(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 # — 3. Validation schema with Pandera —
-schema = DataFrameSchema({
-    "team":        Column(str,   Check.isin(df_raw["team"].unique()), nullable=False),
-    "year":        Column(int,   Check.in_range(2008, datetime.now().year), nullable=False),
-    "position":    Column(int,   Check.in_range(1, 10), nullable=False),
-    "top_scorer":  Column(str,   Check.str_length(1, 100), nullable=False),
-    "top_wickets": Column(str,   Check.str_length(1, 100), nullable=False),
-})
+def build_schema(df: pd.DataFrame) -> DataFrameSchema:
+    """Schema for the team stats; valid team names are taken from `df`."""
+    return DataFrameSchema({
+        "team":        Column(str,   Check.isin(df["team"].unique()), nullable=False),
+        "year":        Column(int,   Check.in_range(2008, datetime.now().year), nullable=False),
+        "position":    Column(int,   Check.in_range(1, 10), nullable=False),
+        "top_scorer":  Column(str,   Check.str_length(1, 100), nullable=False),
+        "top_wickets": Column(str,   Check.str_length(1, 100), nullable=False),
+    })
 
 def validate(df: pd.DataFrame) -> pd.DataFrame:
     """Run Pandera schema validation (raises on failure)."""
-    return schema.validate(df, lazy=True)
+    return build_schema(df).validate(df, lazy=True)
 
 # — 4. Feature engineering transformer —
 def add_features(df: pd.DataFrame) -> pd.DataFrame:
@@ -85,7 +92,10 @@ def clean_pipeline(df: pd.DataFrame) -> pd.DataFrame:
         .pipe(add_features)
     )
 
-if __name__ == "__main__":
+def main(raw_path: str = RAW_PATH, clean_path: str = CLEAN_PATH,
+         features_path: str = FEATURES_PATH) -> None:
+    df_raw = load_raw(raw_path)
+
     # run cleaning
     df_clean = clean_pipeline(df_raw)
     print(f"Cleaned data shape: {df_clean.shape}")
@@ -95,10 +105,8 @@ if __name__ == "__main__":
     print(f"Feature matrix shape: {X.shape}")
 
     # save cleaned and features
-    CLEAN_PATH = "ipl_team_stats_cleaned.csv"
-    FEATURES_PATH = "ipl_team_features.csv"
-    df_clean.to_csv(CLEAN_PATH, index=False)
-    X.to_csv(FEATURES_PATH, index=False)
+    df_clean.to_csv(clean_path, index=False)
+    X.to_csv(features_path, index=False)
     print("Saved cleaned and feature data.")
 
     # — 7. Data versioning with DVC —
@@ -109,3 +117,6 @@ if __name__ == "__main__":
     # > dvc add ipl_team_features.csv
     # > git add .dvc config dvc.lock dvc.yaml
     # > git commit -m "Add data versioning for IPL pipeline"
+
+if __name__ == "__main__":
+    main()
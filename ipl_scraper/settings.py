@@ -10,8 +10,13 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
+from importlib.util import find_spec
 from pathlib import Path
 
+import django
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -74,17 +79,68 @@ WSGI_APPLICATION = 'ipl_scraper.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE':   'django.db.backends.postgresql',
-        'NAME':     'ipl_stats',
-        'USER':     '',
-        'PASSWORD': '',
-        'HOST':     'localhost',
-        'PORT':     '',
+# Persistent connections are reused for IPL_DB_CONN_MAX_AGE seconds.
+# Setting IPL_DB_POOL=1 switches to psycopg 3's connection pool instead
+# (Django 5.1+); the pool replaces persistent connections, so
+# CONN_MAX_AGE is forced to 0 in that case.
+DB_POOL = os.environ.get('IPL_DB_POOL', '') == '1'
+if DB_POOL and (django.VERSION < (5, 1) or not find_spec('psycopg_pool')):
+    # Older Django passes OPTIONS['pool'] straight to the driver, which
+    # makes every connection fail instead of reporting the problem.
+    raise ImproperlyConfigured(
+        "IPL_DB_POOL=1 needs Django 5.1+ and psycopg 3 with pooling "
+        "(pip install 'Django>=5.1' 'psycopg[binary,pool]'); "
+        f"found Django {django.get_version()}"
+        + ("" if find_spec('psycopg_pool') else " without psycopg_pool")
+    )
+DB_CONN_MAX_AGE = 0 if DB_POOL else int(os.environ.get('IPL_DB_CONN_MAX_AGE', '60'))
+
+
+def _database(name, host, port):
+    db = {
+        'ENGINE':   'stats.db_backend',
+        'NAME':     name,
+        'USER':     os.environ.get('IPL_DB_USER', ''),
+        'PASSWORD': os.environ.get('IPL_DB_PASSWORD', ''),
+        'HOST':     host,
+        'PORT':     port,
+        'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': DB_CONN_MAX_AGE > 0,
     }
+    if DB_POOL:
+        db['OPTIONS'] = {
+            'pool': {
+                'min_size': int(os.environ.get('IPL_DB_POOL_MIN', '2')),
+                'max_size': int(os.environ.get('IPL_DB_POOL_MAX', '10')),
+                'timeout':  int(os.environ.get('IPL_DB_POOL_TIMEOUT', '10')),
+            },
+        }
+    return db
+
+
+DATABASES = {
+    'default': _database(
+        os.environ.get('IPL_DB_NAME', 'ipl_stats'),
+        os.environ.get('IPL_DB_HOST', 'localhost'),
+        os.environ.get('IPL_DB_PORT', ''),
+    ),
 }
 
+# Optional read replica: PlayerSeasonStat reads are routed here by
+# stats.routers.PrimaryReplicaRouter, all writes stay on 'default'.
+# For local testing, point IPL_DB_REPLICA_NAME at a second database.
+# Under the test runner the replica mirrors the default test database,
+# so routed reads see rows written by the tests.
+if os.environ.get('IPL_DB_REPLICA_NAME') or os.environ.get('IPL_DB_REPLICA_HOST'):
+    DATABASES['replica'] = _database(
+        os.environ.get('IPL_DB_REPLICA_NAME', DATABASES['default']['NAME']),
+        os.environ.get('IPL_DB_REPLICA_HOST', DATABASES['default']['HOST']),
+        os.environ.get('IPL_DB_REPLICA_PORT', DATABASES['default']['PORT']),
+    )
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+
+DATABASE_ROUTERS = ['stats.routers.PrimaryReplicaRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -1,3 +1,99 @@
 from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils import timezone
+from django.utils.functional import cached_property
 
-# Register your models here.
+from .models import PlayerSeasonStat
+from .teams import all_team_names
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Uses the planner's row estimate instead of COUNT(*) for unfiltered
+    changelists on large PostgreSQL tables. Filtered or small result
+    sets still get an exact count.
+    """
+
+    estimate_threshold = 100_000
+
+    @cached_property
+    def count(self):
+        qs = self.object_list
+        conn = connections[qs.db]
+        if conn.vendor == 'postgresql' and not qs.query.where:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [qs.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= self.estimate_threshold:
+                return row[0]
+        return super().count
+
+
+class YearFilter(admin.SimpleListFilter):
+    """
+    Seasons from 2008 to the current year; needs no query to list them.
+    """
+
+    title = 'year'
+    parameter_name = 'year'
+
+    def lookups(self, request, model_admin):
+        return [(str(y), str(y)) for y in range(timezone.now().year, 2007, -1)]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            if not self.value().isdigit():
+                raise IncorrectLookupParameters(f"Invalid year {self.value()!r}")
+            return queryset.filter(year=self.value())
+        return queryset
+
+
+class TeamFilter(admin.SimpleListFilter):
+    """
+    Franchise names derived from stats.teams, so listing them needs no
+    DISTINCT scan over the table.
+    """
+
+    title = 'team'
+    parameter_name = 'team'
+
+    def lookups(self, request, model_admin):
+        return [(t, t) for t in all_team_names(timezone.now().year)]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(team=self.value())
+        return queryset
+
+
+class ProjectedChangeList(ChangeList):
+    """
+    Only selects the columns shown in list_display.
+    """
+
+    def get_queryset(self, request, exclude_parameters=None):
+        qs = super().get_queryset(request, exclude_parameters)
+        return qs.only('pk', *self.model_admin.projected_fields)
+
+
+@admin.register(PlayerSeasonStat)
+class PlayerSeasonStatAdmin(admin.ModelAdmin):
+    list_display = ('player', 'team', 'year', 'role', 'total_runs', 'total_wickets')
+    projected_fields = list_display
+    list_filter = (YearFilter, TeamFilter, 'role')
+    # icontains compiles to UPPER(player) LIKE ..., which PostgreSQL serves
+    # from the trigram index added in migration 0006.
+    search_fields = ('player',)
+    search_help_text = 'Any part of the player name, e.g. "carey"'
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 50
+
+    def get_changelist(self, request, **kwargs):
+        return ProjectedChangeList
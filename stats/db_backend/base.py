@@ -0,0 +1,16 @@
+# stats/db_backend/base.py
+
+"""
+PostgreSQL backend that records connection-wait and query-time metrics.
+
+Behaves exactly like django.db.backends.postgresql; select it with
+ENGINE = 'stats.db_backend'. Counters are read via stats.db_metrics.
+"""
+
+from django.db.backends.postgresql import base
+
+from stats.db_metrics import MetricsWrapperMixin
+
+
+class DatabaseWrapper(MetricsWrapperMixin, base.DatabaseWrapper):
+    pass
@@ -0,0 +1,73 @@
+# stats/db_metrics.py
+
+"""
+Process-wide connection and query timing counters, per database alias.
+"""
+
+import threading
+import time
+from collections import defaultdict
+
+_lock = threading.Lock()
+_metrics = defaultdict(lambda: {
+    'connections': 0,
+    'connect_seconds': 0.0,
+    'queries': 0,
+    'query_seconds': 0.0,
+})
+
+def record_connect(alias, seconds):
+    """
+    Count a new connection and the time spent waiting for it.
+    """
+    with _lock:
+        m = _metrics[alias]
+        m['connections'] += 1
+        m['connect_seconds'] += seconds
+
+def record_query(alias, seconds):
+    """
+    Count one executed statement and its wall-clock time.
+    """
+    with _lock:
+        m = _metrics[alias]
+        m['queries'] += 1
+        m['query_seconds'] += seconds
+
+def snapshot():
+    """
+    Return a copy of the counters, e.g. {'default': {'queries': 12, ...}}.
+    """
+    with _lock:
+        return {alias: dict(m) for alias, m in _metrics.items()}
+
+def reset():
+    with _lock:
+        _metrics.clear()
+
+
+class MetricsWrapperMixin:
+    """
+    Mix into a Django DatabaseWrapper to record connect and query timings.
+
+    Backend-agnostic so it can wrap PostgreSQL in production and SQLite
+    in tests; see stats.db_backend.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.execute_wrappers.append(self._time_query)
+
+    def connect(self):
+        # With pooling enabled this includes the time spent waiting for a
+        # free pooled connection, otherwise the full connect handshake.
+        start = time.perf_counter()
+        super().connect()
+        record_connect(self.alias, time.perf_counter() - start)
+
+    def _time_query(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            record_query(self.alias, time.perf_counter() - start)
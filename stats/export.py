@@ -0,0 +1,108 @@
+# stats/export.py
+
+"""
+Streaming CSV / NDJSON export of PlayerSeasonStat rows.
+
+Rows are read with QuerySet.iterator(), which uses a server-side cursor
+on PostgreSQL, and written out one chunk at a time, so memory use stays
+flat however many rows are exported. Iteration runs inside a transaction:
+outside one, Django declares the cursor WITH HOLD and PostgreSQL
+materialises the whole result at commit before returning the first row.
+"""
+
+import csv
+import io
+import json
+import zlib
+
+from django.db import transaction
+
+from .models import PlayerSeasonStat
+
+COLUMNS = (
+    'year', 'team', 'player', 'role',
+    'total_runs', 'total_fours', 'total_sixes',
+    'total_wickets', 'total_dots', 'total_fifties',
+)
+# Same headers as the scraped CSVs, so exports can be fed back to `cli.py load`.
+CSV_HEADERS = (
+    'Year', 'Team', 'Player', 'Role',
+    'Total Runs', 'Total Fours', 'Total Sixes',
+    'Total Wickets', 'Total Dots', 'Total 50s',
+)
+FORMATS = ('csv', 'ndjson')
+CHUNK_SIZE = 2000
+
+def export_queryset(start_year=None, end_year=None, team=None, role=None):
+    """
+    PlayerSeasonStat rows filtered by year range, team and role.
+    """
+    qs = PlayerSeasonStat.objects.order_by('year', 'team', 'player')
+    if start_year is not None:
+        qs = qs.filter(year__gte=start_year)
+    if end_year is not None:
+        qs = qs.filter(year__lte=end_year)
+    if team:
+        qs = qs.filter(team=team)
+    if role:
+        qs = qs.filter(role=role)
+    return qs
+
+def iter_csv(queryset, chunk_size=CHUNK_SIZE):
+    """
+    Yield CSV text, one chunk of up to `chunk_size` rows at a time.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(CSV_HEADERS)
+    yield buf.getvalue()
+
+    buf.seek(0)
+    buf.truncate()
+    n = 0
+    with transaction.atomic(using=queryset.db):
+        for row in queryset.values_list(*COLUMNS).iterator(chunk_size=chunk_size):
+            writer.writerow(row)
+            n += 1
+            if n == chunk_size:
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+                n = 0
+    if n:
+        yield buf.getvalue()
+
+def iter_ndjson(queryset, chunk_size=CHUNK_SIZE):
+    """
+    Yield newline-delimited JSON objects keyed by model field name.
+    """
+    lines = []
+    with transaction.atomic(using=queryset.db):
+        for row in queryset.values(*COLUMNS).iterator(chunk_size=chunk_size):
+            lines.append(json.dumps(row, ensure_ascii=False))
+            if len(lines) == chunk_size:
+                yield '\n'.join(lines) + '\n'
+                lines = []
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+def gzip_stream(chunks):
+    """
+    Gzip-compress a stream of bytes chunks on the fly.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def stream_export(queryset, fmt='csv', compress=False, chunk_size=CHUNK_SIZE):
+    """
+    Encoded export of `queryset` as an iterator of bytes.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}")
+    rows = iter_csv if fmt == 'csv' else iter_ndjson
+    chunks = (text.encode('utf-8') for text in rows(queryset, chunk_size))
+    return gzip_stream(chunks) if compress else chunks
@@ -1,19 +1,41 @@
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from stats.models import PlayerStat
-from stats.models import PlayerStatArchive  # define this model similarly
+from django.db import router, transaction
+from stats.export import export_queryset, stream_export
+from stats.models import PlayerSeasonStat
 
 class Command(BaseCommand):
-    help = 'Archive old player stats'
+    help = 'Archive old player-season stats to a gzipped CSV, optionally deleting them'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--cutoff', type=int, default=2018,
+                            help='Archive seasons up to and including this year (default 2018)')
+        parser.add_argument('--output', help='Archive file (default: ipl_stats_upto_<cutoff>.csv.gz)')
+        parser.add_argument('--delete', action='store_true',
+                            help='Delete the archived rows from the database afterwards')
 
     def handle(self, *args, **options):
-        cutoff = 2018
-        qs = PlayerStat.objects.filter(year__lte=cutoff)
+        cutoff = options['cutoff']
+        output = options['output'] or f"ipl_stats_upto_{cutoff}.csv.gz"
+
+        # Read from the same database the rows are deleted from; a lagging
+        # replica would otherwise let unarchived rows be deleted.
+        db = router.db_for_write(PlayerSeasonStat)
+        with open(output, 'wb') as fh:
+            qs = export_queryset(end_year=cutoff).using(db)
+            for chunk in stream_export(qs, 'csv', compress=True):
+                fh.write(chunk)
+        self.stdout.write(f"Archived seasons up to {cutoff} to {output}")
+
+        if not options['delete']:
+            return
+        qs = PlayerSeasonStat.objects.using(db).filter(year__lte=cutoff)
         batch = 1000
-        while qs.exists():
-            with transaction.atomic():
-                chunk = list(qs[:batch])
-                archives = [PlayerStatArchive(**obj.__dict__) for obj in chunk]
-                PlayerStatArchive.objects.bulk_create(archives)
-                PlayerStat.objects.filter(pk__in=[o.pk for o in chunk]).delete()
-            self.stdout.write(f"Archived {len(chunk)} records")
+        total = 0
+        while True:
+            with transaction.atomic(using=db):
+                pks = list(qs.values_list('pk', flat=True)[:batch])
+                if not pks:
+                    break
+                PlayerSeasonStat.objects.using(db).filter(pk__in=pks).delete()
+            total += len(pks)
+        self.stdout.write(f"Deleted {total} archived records")
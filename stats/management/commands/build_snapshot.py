@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from stats.snapshot import build_snapshot
+
+class Command(BaseCommand):
+    help = 'Write PlayerSeasonStat rows to a memory-mappable binary snapshot'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default='ipl_stats.snap',
+                            help='Snapshot file to write (default: ipl_stats.snap)')
+
+    def handle(self, *args, **options):
+        n = build_snapshot(options['output'])
+        self.stdout.write(f"Wrote {n} records to {options['output']}")
@@ -0,0 +1,31 @@
+import sys
+
+from django.core.management.base import BaseCommand
+from stats.export import FORMATS, export_queryset, stream_export
+
+class Command(BaseCommand):
+    help = 'Stream player-season stats to a CSV or NDJSON file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default='-', help='Output file (default: stdout)')
+        parser.add_argument('--format', choices=FORMATS, default='csv')
+        parser.add_argument('--start-year', type=int)
+        parser.add_argument('--end-year', type=int)
+        parser.add_argument('--team')
+        parser.add_argument('--role')
+        parser.add_argument('--gzip', action='store_true', help='Gzip the output')
+
+    def handle(self, *args, **options):
+        qs = export_queryset(options['start_year'], options['end_year'],
+                             options['team'], options['role'])
+        chunks = stream_export(qs, options['format'], options['gzip'])
+        if options['output'] == '-':
+            out = sys.stdout.buffer
+            for chunk in chunks:
+                out.write(chunk)
+            out.flush()
+        else:
+            with open(options['output'], 'wb') as fh:
+                for chunk in chunks:
+                    fh.write(chunk)
+            self.stderr.write(f"Exported to {options['output']}")
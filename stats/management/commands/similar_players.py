@@ -0,0 +1,78 @@
+from django.core.management.base import BaseCommand, CommandError
+from stats import similarity
+
+class Command(BaseCommand):
+    help = 'Build/update the player similarity index and query it'
+
+    def add_arguments(self, parser):
+        parser.add_argument('player', nargs='?', help='Player to find neighbours for')
+        parser.add_argument('--year', type=int, help='Season of the player (season index)')
+        parser.add_argument('--team', help='Team, if the player moved mid-history')
+        parser.add_argument('--career', action='store_true',
+                            help='Use the career-totals index instead of single seasons')
+        parser.add_argument('-k', type=int, default=5, help='Number of neighbours')
+        parser.add_argument('--any-season', action='store_true',
+                            help='Search neighbours across all seasons, not just --year')
+        parser.add_argument('--index',
+                            help='Persisted index (default: ipl_similarity.pkl, '
+                                 'or ipl_similarity_career.pkl with --career)')
+        parser.add_argument('--rebuild', action='store_true', help='Rebuild the index')
+        parser.add_argument('--add-year', type=int,
+                            help='Add one season (or refresh its players\' careers)')
+        parser.add_argument('--benchmark', action='store_true',
+                            help='Time index queries against brute-force pandas')
+
+    def handle(self, *args, **options):
+        career = options['career']
+        path = options['index'] or (
+            'ipl_similarity_career.pkl' if career else 'ipl_similarity.pkl')
+        if career and (options['year'] or options['team'] or options['any_season']):
+            raise CommandError("--year/--team/--any-season apply to season queries, not --career")
+
+        if options['rebuild']:
+            build = similarity.build_career_index if career else similarity.build_season_index
+            try:
+                index = build()
+            except ValueError as exc:
+                raise CommandError(str(exc))
+            index.save(path)
+            self.stdout.write(f"Indexed {len(index)} {'players' if career else 'player-seasons'} to {path}")
+        else:
+            try:
+                index = similarity.SimilarityIndex.load(path)
+            except FileNotFoundError:
+                raise CommandError(f"{path} not found, run with --rebuild first")
+
+        if options['add_year']:
+            update = similarity.update_career_index if career else similarity.update_season_index
+            n = update(index, options['add_year'])
+            index.save(path)
+            self.stdout.write(f"Updated {n} entries for {options['add_year']}")
+
+        if options['benchmark']:
+            result = similarity.benchmark(index, k=options['k'])
+            self.stdout.write(
+                f"{result['rows']} rows: index {result['index_seconds'] * 1000:.3f} ms/query, "
+                f"pandas {result['pandas_seconds'] * 1000:.3f} ms/query")
+
+        player = options['player']
+        if not player:
+            return
+        year = None
+        if career:
+            key = (player,)
+        else:
+            if options['year'] is None:
+                raise CommandError("--year is required for season queries")
+            matches = [key for key in index.keys
+                       if key[0] == player and key[2] == options['year']
+                       and options['team'] in (None, key[1])]
+            if not matches:
+                raise CommandError(f"No {options['year']} season for {player}")
+            key = matches[0]
+            if not options['any_season']:
+                year = options['year']
+        if key not in index:
+            raise CommandError(f"{player} is not in the index")
+        for other, dist in index.similar_to(key, k=options['k'], year=year):
+            self.stdout.write(f"{dist:8.3f}  {' / '.join(str(p) for p in other)}")
@@ -0,0 +1,59 @@
+from django.db import migrations, models
+
+
+def backfill_derived(apps, schema_editor):
+    PlayerSeasonStat = apps.get_model('stats', 'PlayerSeasonStat')
+    db = schema_editor.connection.alias
+    batch = []
+    for obj in PlayerSeasonStat.objects.using(db).iterator(chunk_size=2000):
+        boundaries = obj.total_fours + obj.total_sixes
+        boundary_runs = 4 * obj.total_fours + 6 * obj.total_sixes
+        obj.boundary_pct = 100.0 * boundary_runs / obj.total_runs if obj.total_runs else None
+        obj.dots_per_wicket = obj.total_dots / obj.total_wickets if obj.total_wickets else None
+        obj.runs_per_boundary = obj.total_runs / boundaries if boundaries else None
+        batch.append(obj)
+        if len(batch) >= 2000:
+            PlayerSeasonStat.objects.using(db).bulk_update(
+                batch, ['boundary_pct', 'dots_per_wicket', 'runs_per_boundary'])
+            batch = []
+    if batch:
+        PlayerSeasonStat.objects.using(db).bulk_update(
+            batch, ['boundary_pct', 'dots_per_wicket', 'runs_per_boundary'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stats', '0003_playerseasonstat_delete_playerstat_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='playerseasonstat',
+            name='boundary_pct',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='playerseasonstat',
+            name='dots_per_wicket',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='playerseasonstat',
+            name='runs_per_boundary',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='playerseasonstat',
+            index=models.Index(fields=['boundary_pct'], name='stats_boundary_pct_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='playerseasonstat',
+            index=models.Index(fields=['dots_per_wicket'], name='stats_dots_per_wicket_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='playerseasonstat',
+            index=models.Index(fields=['runs_per_boundary'], name='stats_runs_per_boundary_idx'),
+        ),
+        migrations.RunPython(backfill_derived, migrations.RunPython.noop),
+    ]
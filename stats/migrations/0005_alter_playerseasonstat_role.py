@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stats', '0004_playerseasonstat_derived_metrics'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='playerseasonstat',
+            name='role',
+            field=models.CharField(choices=[('Batsman', 'Batsman'), ('Bowler', 'Bowler'), ('All-rounder', 'All-rounder'), ('Wicket-keeper', 'Wicket-keeper')], db_index=True, max_length=32),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+# Case-insensitive substring search (admin search uses player__icontains,
+# i.e. UPPER(player::text) LIKE UPPER(%s)) served by a trigram index on the
+# same expression. PostgreSQL only; other backends keep a plain scan.
+CREATE_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS stats_player_upper_trgm_idx "
+    "ON stats_playerseasonstat USING gin (UPPER(player::text) gin_trgm_ops)",
+]
+DROP_SQL = ["DROP INDEX IF EXISTS stats_player_upper_trgm_idx"]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stats', '0005_alter_playerseasonstat_role'),
+    ]
+
+    operations = [
+        migrations.RunPython(_run(CREATE_SQL), _run(DROP_SQL)),
+    ]
@@ -17,7 +17,7 @@ class PlayerSeasonStat(models.Model):
     year = models.PositiveSmallIntegerField(db_index=True)
     team = models.CharField(max_length=64, db_index=True)
     player = models.CharField(max_length=128, db_index=True)
-    role = models.CharField(max_length=32, choices=ROLE_CHOICES)
+    role = models.CharField(max_length=32, choices=ROLE_CHOICES, db_index=True)
     total_runs = models.PositiveIntegerField()
     total_fours = models.PositiveIntegerField()
     total_sixes = models.PositiveIntegerField()
@@ -25,12 +25,43 @@ class PlayerSeasonStat(models.Model):
     total_dots = models.PositiveIntegerField()
     total_fifties = models.PositiveIntegerField()
 
+    # Derived ratios, stored so leaderboards can be read from an index.
+    # Filled by compute_derived(); NULL when the denominator is zero.
+    boundary_pct      = models.FloatField(null=True, blank=True, editable=False)
+    dots_per_wicket   = models.FloatField(null=True, blank=True, editable=False)
+    runs_per_boundary = models.FloatField(null=True, blank=True, editable=False)
+
+    DERIVED_METRICS = ('boundary_pct', 'dots_per_wicket', 'runs_per_boundary')
+
     class Meta:
         unique_together = (('year', 'team', 'player'),)
         indexes = [
             models.Index(fields=['year', 'team']),
+            models.Index(fields=['boundary_pct'], name='stats_boundary_pct_idx'),
+            models.Index(fields=['dots_per_wicket'], name='stats_dots_per_wicket_idx'),
+            models.Index(fields=['runs_per_boundary'], name='stats_runs_per_boundary_idx'),
         ]
         ordering = ['-year', 'team', 'player']
 
     def __str__(self):
         return f"{self.player} ({self.team}, {self.year})"
+
+    def compute_derived(self):
+        """
+        Recompute the stored ratio columns from the raw totals.
+        """
+        boundaries = self.total_fours + self.total_sixes
+        boundary_runs = 4 * self.total_fours + 6 * self.total_sixes
+        self.boundary_pct = (
+            100.0 * boundary_runs / self.total_runs if self.total_runs else None
+        )
+        self.dots_per_wicket = (
+            self.total_dots / self.total_wickets if self.total_wickets else None
+        )
+        self.runs_per_boundary = (
+            self.total_runs / boundaries if boundaries else None
+        )
+
+    def save(self, *args, **kwargs):
+        self.compute_derived()
+        super().save(*args, **kwargs)
@@ -0,0 +1,31 @@
+# stats/routers.py
+
+from django.conf import settings
+from django.db import connections
+
+class PrimaryReplicaRouter:
+    """
+    Sends PlayerSeasonStat reads to the 'replica' alias when one is
+    configured, and every write to 'default' (the primary).
+
+    Inside a transaction on the primary, reads stay on the primary so
+    they see that transaction's own uncommitted writes (this also keeps
+    TestCase, which wraps each test in a transaction, consistent).
+    """
+
+    replica_models = {'playerseasonstat'}
+
+    def db_for_read(self, model, **hints):
+        if (model._meta.app_label == 'stats'
+                and model._meta.model_name in self.replica_models
+                and 'replica' in settings.DATABASES
+                and not connections['default'].in_atomic_block):
+            return 'replica'
+        return None
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data, so relations across them are fine.
+        return True
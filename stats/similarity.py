@@ -0,0 +1,221 @@
+# stats/similarity.py
+
+"""
+Nearest-neighbour search over PlayerSeasonStat stat vectors.
+
+Vectors are the raw season totals standardised with a StandardScaler,
+indexed with a KD-tree once the data is large enough for it to beat a
+batched NumPy brute-force scan. The scaler is fitted once when an index
+is built and kept fixed on incremental updates, so vectors added later
+stay comparable with the ones already stored.
+"""
+
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+from django.db.models import Sum
+from sklearn.neighbors import KDTree
+from sklearn.preprocessing import StandardScaler
+
+from .models import PlayerSeasonStat
+
+FEATURES = [
+    'total_runs', 'total_fours', 'total_sixes',
+    'total_wickets', 'total_dots', 'total_fifties',
+]
+
+# Below this many rows a single vectorised distance pass is faster than
+# building and walking a tree.
+BRUTE_FORCE_MAX = 2000
+
+
+class SimilarityIndex:
+    """
+    Maps keys (e.g. (player, team, year)) to standardised stat vectors.
+    """
+
+    def __init__(self, keys, raw):
+        self.keys = list(keys)
+        self.raw = np.asarray(raw, dtype=float).reshape(len(self.keys), len(FEATURES))
+        self.scaler = StandardScaler().fit(self.raw)
+        self._build()
+
+    def _build(self):
+        self._positions = {key: i for i, key in enumerate(self.keys)}
+        self._season_cache = {}
+        self._vectors = self.scaler.transform(self.raw)
+        self._tree = KDTree(self._vectors) if len(self.keys) > BRUTE_FORCE_MAX else None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def add(self, keys, raw):
+        """
+        Insert or replace rows, reusing the fitted scaler.
+        """
+        raw = np.asarray(raw, dtype=float).reshape(-1, len(FEATURES))
+        new_keys, new_rows = [], []
+        for key, row in zip(keys, raw):
+            pos = self._positions.get(key)
+            if pos is None:
+                new_keys.append(key)
+                new_rows.append(row)
+            else:
+                self.raw[pos] = row
+        if new_keys:
+            self.keys.extend(new_keys)
+            self.raw = np.vstack([self.raw, new_rows])
+        self._build()
+
+    def _season_positions(self, year):
+        """
+        Positions of (player, team, year) keys belonging to one season.
+        """
+        positions = self._season_cache.get(year)
+        if positions is None:
+            positions = self._season_cache[year] = np.array(
+                [i for i, key in enumerate(self.keys) if len(key) == 3 and key[2] == year],
+                dtype=int,
+            )
+        return positions
+
+    def query_vector(self, raw, k=5, year=None):
+        """
+        Return the k nearest (key, distance) pairs to a raw stat vector.
+
+        With `year`, only that season's keys are candidates; a season is
+        small enough that a brute-force pass over it beats the tree.
+        """
+        z = self.scaler.transform(np.asarray(raw, dtype=float).reshape(1, -1))
+        if year is not None:
+            candidates = self._season_positions(year)
+        elif self._tree is not None:
+            k = min(k, len(self.keys))
+            dist, idx = self._tree.query(z, k=k)
+            return [(self.keys[i], float(x)) for i, x in zip(idx[0], dist[0])]
+        else:
+            candidates = np.arange(len(self.keys))
+
+        k = min(k, len(candidates))
+        if k == 0:
+            return []
+        d = np.sqrt(((self._vectors[candidates] - z) ** 2).sum(axis=1))
+        order = np.argpartition(d, k - 1)[:k]
+        order = order[np.argsort(d[order])]
+        return [(self.keys[candidates[i]], float(d[i])) for i in order]
+
+    def similar_to(self, key, k=5, year=None):
+        """
+        Return the k nearest neighbours of an indexed key, excluding itself.
+
+        Pass `year` to restrict neighbours to one season (season index only).
+        """
+        pos = self._positions[key]
+        hits = self.query_vector(self.raw[pos], k=k + 1, year=year)
+        return [(other, dist) for other, dist in hits if other != key][:k]
+
+    def save(self, path):
+        with open(path, 'wb') as fh:
+            pickle.dump({'keys': self.keys, 'raw': self.raw, 'scaler': self.scaler}, fh)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as fh:
+            state = pickle.load(fh)
+        index = cls.__new__(cls)
+        index.keys = state['keys']
+        index.raw = state['raw']
+        index.scaler = state['scaler']
+        index._build()
+        return index
+
+
+def _season_rows(queryset):
+    rows = queryset.values_list('player', 'team', 'year', *FEATURES)
+    keys, raw = [], []
+    for row in rows.iterator(chunk_size=2000):
+        keys.append(row[:3])
+        raw.append(row[3:])
+    return keys, raw
+
+
+def build_season_index(queryset=None):
+    """
+    Index every player-season, keyed by (player, team, year).
+    """
+    if queryset is None:
+        queryset = PlayerSeasonStat.objects.all()
+    keys, raw = _season_rows(queryset)
+    if not keys:
+        raise ValueError("No player-season rows to index")
+    return SimilarityIndex(keys, raw)
+
+
+def update_season_index(index, year):
+    """
+    Add (or refresh) one season's rows in an existing season index.
+    """
+    keys, raw = _season_rows(PlayerSeasonStat.objects.filter(year=year))
+    if keys:
+        index.add(keys, raw)
+    return len(keys)
+
+
+def _career_rows(queryset):
+    rows = (queryset.order_by()
+            .values('player')
+            .annotate(**{f: Sum(f) for f in FEATURES}))
+    keys = [(r['player'],) for r in rows]
+    raw = [[r[f] for f in FEATURES] for r in rows]
+    return keys, raw
+
+
+def build_career_index(queryset=None):
+    """
+    Index career totals summed across seasons, keyed by (player,).
+    """
+    if queryset is None:
+        queryset = PlayerSeasonStat.objects.all()
+    keys, raw = _career_rows(queryset)
+    if not keys:
+        raise ValueError("No player-season rows to index")
+    return SimilarityIndex(keys, raw)
+
+
+def update_career_index(index, year):
+    """
+    Refresh career totals for every player who appears in `year`.
+    """
+    players = PlayerSeasonStat.objects.filter(year=year).values('player')
+    keys, raw = _career_rows(PlayerSeasonStat.objects.filter(player__in=players))
+    if keys:
+        index.add(keys, raw)
+    return len(keys)
+
+
+def benchmark(index, n_queries=100, k=5):
+    """
+    Compare index query latency with a brute-force pandas scan.
+
+    Returns mean seconds per query for each approach.
+    """
+    df = pd.DataFrame(index.scaler.transform(index.raw), columns=FEATURES)
+    sample = index.keys[:n_queries]
+
+    start = time.perf_counter()
+    for key in sample:
+        index.similar_to(key, k=k)
+    indexed = (time.perf_counter() - start) / len(sample)
+
+    start = time.perf_counter()
+    for key in sample:
+        z = df.iloc[index._positions[key]]
+        ((df - z) ** 2).sum(axis=1).nsmallest(k + 1)
+    brute = (time.perf_counter() - start) / len(sample)
+
+    return {'index_seconds': indexed, 'pandas_seconds': brute, 'rows': len(index)}
@@ -0,0 +1,215 @@
+# stats/snapshot.py
+
+"""
+Column-oriented binary snapshot of PlayerSeasonStat rows.
+
+Layout (little-endian; everything after the header is uint32):
+
+    header    magic b"IPLS", version (u16), column count (u16),
+              row count (u32), string count (u32)
+    columns   one block of ``row count`` values per entry in COLUMNS;
+              string columns hold codes into the string table
+    strings   ``string count + 1`` byte offsets, then the UTF-8 blob
+
+The loader memory-maps the file read-only, so every process opening the
+same snapshot shares the page cache instead of holding its own copy.
+Only the stdlib is used so analysis sessions can open a snapshot without
+configuring Django.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+MAGIC = b"IPLS"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHII")
+
+# Native typecode with a 4-byte item, used both to write columns and to
+# cast the mapped views; C only guarantees minimum widths for these.
+_U32 = next((code for code in ('I', 'L') if array(code).itemsize == 4), None)
+
+STRING_COLUMNS = ('team', 'player', 'role')
+COLUMNS = (
+    'year', 'team', 'player', 'role',
+    'total_runs', 'total_fours', 'total_sixes',
+    'total_wickets', 'total_dots', 'total_fifties',
+)
+
+
+def _le(values):
+    """
+    Return a uint32 array of values in little-endian byte order.
+    """
+    if _U32 is None:
+        raise RuntimeError("No 4-byte unsigned array typecode on this platform")
+    arr = array(_U32, values)
+    if sys.byteorder != 'little':
+        arr.byteswap()
+    return arr
+
+
+def write_snapshot(path, rows):
+    """
+    Write an iterable of row dicts (keyed by COLUMNS) to ``path``.
+
+    String columns are dictionary-encoded against one shared table,
+    so repeated team/role names are stored once.
+    """
+    codes = {}
+    strings = []
+    columns = {name: [] for name in COLUMNS}
+
+    for row in rows:
+        for name in COLUMNS:
+            value = row[name]
+            if name in STRING_COLUMNS:
+                value = str(value)
+                code = codes.get(value)
+                if code is None:
+                    code = codes[value] = len(strings)
+                    strings.append(value)
+                value = code
+            columns[name].append(int(value))
+
+    n_rows = len(columns['year'])
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = [0]
+    for b in encoded:
+        offsets.append(offsets[-1] + len(b))
+
+    with open(path, 'wb') as fh:
+        fh.write(_HEADER.pack(MAGIC, VERSION, len(COLUMNS), n_rows, len(strings)))
+        for name in COLUMNS:
+            _le(columns[name]).tofile(fh)
+        _le(offsets).tofile(fh)
+        fh.write(b''.join(encoded))
+    return n_rows
+
+
+def build_snapshot(path, queryset=None):
+    """
+    Dump PlayerSeasonStat rows (or the given queryset) to a snapshot file.
+    """
+    from .models import PlayerSeasonStat
+
+    if queryset is None:
+        queryset = PlayerSeasonStat.objects.all()
+    rows = queryset.order_by('year', 'team', 'player').values(*COLUMNS)
+    return write_snapshot(path, rows.iterator(chunk_size=2000))
+
+
+class Snapshot:
+    """
+    Read-only, memory-mapped view over a snapshot file.
+
+    Integer columns are exposed as ``memoryview`` objects cast to uint32,
+    so reading them never copies the underlying pages.
+    """
+
+    def __init__(self, path):
+        if sys.byteorder != 'little' or _U32 is None:
+            raise ValueError("Snapshots can only be memory-mapped on little-endian hosts "
+                             "with a 4-byte unsigned array type")
+        with open(path, 'rb') as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        size = len(self._mm)
+        if size < _HEADER.size:
+            self._mm.close()
+            raise ValueError(f"{path} is too short to be a stats snapshot")
+        magic, version, n_cols, n_rows, n_strings = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION or n_cols != len(COLUMNS):
+            self._mm.close()
+            raise ValueError(f"{path} is not a version {VERSION} stats snapshot")
+
+        width = n_rows * 4
+        blob_start = _HEADER.size + len(COLUMNS) * width + (n_strings + 1) * 4
+        blob_len = None
+        if size >= blob_start:
+            (blob_len,) = struct.unpack_from('<I', self._mm, blob_start - 4)
+        if blob_len is None or size != blob_start + blob_len:
+            self._mm.close()
+            raise ValueError(f"{path} is truncated or corrupt: {size} bytes does not "
+                             f"match the header ({n_rows} rows, {n_strings} strings)")
+
+        self._view = memoryview(self._mm)
+        self.n_rows = n_rows
+        self._columns = {}
+        pos = _HEADER.size
+        for name in COLUMNS:
+            self._columns[name] = self._view[pos:pos + width].cast(_U32)
+            pos += width
+
+        self._offsets = self._view[pos:blob_start].cast(_U32)
+        self._blob_start = blob_start
+        self._strings = [None] * n_strings
+
+    def __len__(self):
+        return self.n_rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """
+        Release all views and unmap the file.
+        """
+        if self._mm.closed:
+            return
+        for col in self._columns.values():
+            col.release()
+        self._offsets.release()
+        self._view.release()
+        self._mm.close()
+
+    def column(self, name):
+        """
+        Return the raw uint32 column (codes for string columns).
+        """
+        return self._columns[name]
+
+    def string(self, code):
+        """
+        Decode a string-table entry, caching it after first use.
+        """
+        value = self._strings[code]
+        if value is None:
+            start = self._blob_start + self._offsets[code]
+            end = self._blob_start + self._offsets[code + 1]
+            value = self._strings[code] = self._mm[start:end].decode('utf-8')
+        return value
+
+    def values(self, name):
+        """
+        Return a column as a list, decoding string columns.
+        """
+        col = self._columns[name]
+        if name in STRING_COLUMNS:
+            return [self.string(c) for c in col]
+        return col.tolist()
+
+    def row(self, i):
+        """
+        Return row ``i`` as a dict keyed by COLUMNS.
+        """
+        return {
+            name: self.string(col[i]) if name in STRING_COLUMNS else col[i]
+            for name, col in self._columns.items()
+        }
+
+    def __iter__(self):
+        for i in range(self.n_rows):
+            yield self.row(i)
+
+
+def load_snapshot(path):
+    """
+    Memory-map a snapshot written by write_snapshot/build_snapshot.
+    """
+    return Snapshot(path)
@@ -0,0 +1,41 @@
+# stats/teams.py
+
+"""
+IPL franchise keys and their season-by-season names.
+
+Kept free of Selenium and Django imports so both the scraper (ipl.py)
+and the admin can use it cheaply.
+"""
+
+# Current franchises (for naming only)
+TEAMS = ["delhi", "punjab", "chennai-super-kings", "kolkata-knight-riders",
+         "royal-challengers-bangalore", "rajasthan-royals", "mumbai-indians",
+         "hyderabad", "gujarat", "lucknow-supergiants"]
+
+def get_slug(team, year):
+    """Return the correct URL slug for a given team in a given year, or None if not active."""
+    if team == "delhi":
+        return "delhi-daredevils" if year <= 2018 else "delhi-capitals"  # rename in 2019 :contentReference[oaicite:11]{index=11}
+    if team == "punjab":
+        return "kings-xi-punjab" if year <= 2020 else "punjab-kings"     # rename in 2021 :contentReference[oaicite:12]{index=12}
+    if team == "hyderabad":
+        return "deccan-chargers" if year <= 2012 else "sunrisers-hyderabad"  # re‑launch 2013 :contentReference[oaicite:13]{index=13}
+    if team == "gujarat":
+        return "gujarat-titans" if year >= 2022 else None  # Titans start 2022 :contentReference[oaicite:14]{index=14}
+    if team == "lucknow-supergiants":
+        return "lucknow-supergiants" if year >= 2022 else None  # start 2022 :contentReference[oaicite:15]{index=15}
+    # unchanged slugs for others, active all years
+    return team
+
+def team_name(slug):
+    """Display name stored in PlayerSeasonStat.team for a URL slug."""
+    return slug.replace("-", " ").title()
+
+def all_team_names(last_year):
+    """Every team name used from 2008 to `last_year`, sorted."""
+    return sorted({
+        team_name(slug)
+        for year in range(2008, last_year + 1)
+        for slug in (get_slug(team, year) for team in TEAMS)
+        if slug
+    })
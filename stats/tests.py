@@ -1,3 +1,400 @@
-from django.test import TestCase
+import gzip
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.backends.sqlite3 import base as sqlite_base
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from . import db_metrics, similarity
+from .export import CSV_HEADERS, export_queryset, iter_csv, iter_ndjson, stream_export
+from .models import PlayerSeasonStat
+from .routers import PrimaryReplicaRouter
+from .snapshot import COLUMNS, load_snapshot, write_snapshot
+from .utils import ratio_leaderboard, save_stats_batch
+
+
+def _row(player, year=2016, team='Mumbai Indians', role='Batsman', **totals):
+    row = {name: 0 for name in COLUMNS}
+    row.update(year=year, team=team, player=player, role=role, **totals)
+    return row
+
+
+class SnapshotTests(SimpleTestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.snap')
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def test_round_trip(self):
+        rows = [
+            _row('Rohit sharma', total_runs=489, total_sixes=23),
+            _row('Jasprit bumrah', role='Bowler', total_wickets=15, total_dots=160),
+            _row('Virat kohli', team='Royal Challengers Bangalore', total_runs=973),
+        ]
+        self.assertEqual(write_snapshot(self.path, rows), 3)
+
+        with load_snapshot(self.path) as snap:
+            self.assertEqual(len(snap), 3)
+            self.assertEqual(list(snap), rows)
+            self.assertEqual(snap.values('team'), [r['team'] for r in rows])
+            self.assertEqual(snap.column('total_runs').tolist(), [489, 0, 973])
+            # team and role strings are stored once in the shared table
+            team_codes = snap.column('team').tolist()
+            self.assertEqual(team_codes[0], team_codes[1])
+            self.assertEqual(snap.string(team_codes[2]), 'Royal Challengers Bangalore')
+
+    def test_empty_snapshot(self):
+        self.assertEqual(write_snapshot(self.path, []), 0)
+        with load_snapshot(self.path) as snap:
+            self.assertEqual(len(snap), 0)
+            self.assertEqual(list(snap), [])
+            self.assertEqual(snap.values('player'), [])
+
+    def test_truncated_file_is_rejected(self):
+        write_snapshot(self.path, [_row('Rohit sharma'), _row('Ishan kishan')])
+        with open(self.path, 'r+b') as fh:
+            fh.truncate(os.path.getsize(self.path) - 5)
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path)
+
+    def test_foreign_file_is_rejected(self):
+        with open(self.path, 'wb') as fh:
+            fh.write(b'Year,Team,Player\n')
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path)
+
+
+def _stat(player, year=2016, **totals):
+    fields = dict(total_runs=0, total_fours=0, total_sixes=0,
+                  total_wickets=0, total_dots=0, total_fifties=0)
+    fields.update(totals)
+    return PlayerSeasonStat(year=year, team='Mumbai Indians', player=player,
+                            role='Batsman', **fields)
+
+
+class DerivedMetricTests(TestCase):
+
+    def test_ratios(self):
+        stat = _stat('Kieron pollard', total_runs=100, total_fours=5, total_sixes=10,
+                     total_wickets=4, total_dots=30)
+        stat.compute_derived()
+        self.assertAlmostEqual(stat.boundary_pct, 80.0)
+        self.assertAlmostEqual(stat.dots_per_wicket, 7.5)
+        self.assertAlmostEqual(stat.runs_per_boundary, 100 / 15)
+
+    def test_zero_denominators_are_null(self):
+        stat = _stat('Jasprit bumrah', total_dots=40)
+        stat.save()
+        stat.refresh_from_db()
+        self.assertIsNone(stat.boundary_pct)
+        self.assertIsNone(stat.dots_per_wicket)
+        self.assertIsNone(stat.runs_per_boundary)
+
+    def test_leaderboard_orders_and_skips_nulls(self):
+        _stat('A', total_runs=100, total_fours=10).save()                # 40%
+        _stat('B', total_runs=100, total_sixes=10).save()                # 60%
+        _stat('C', total_runs=100, total_fours=5, year=2017).save()      # 20%
+        _stat('D').save()                                                # NULL
+
+        self.assertEqual([s.player for s in ratio_leaderboard('boundary_pct')],
+                         ['B', 'A', 'C'])
+        self.assertEqual([s.player for s in ratio_leaderboard('boundary_pct', year=2016, limit=1)],
+                         ['B'])
+        with self.assertRaises(ValueError):
+            ratio_leaderboard('total_runs')
+
+
+REPLICA = {'replica': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}}
+
+
+class RouterTests(TransactionTestCase):
+
+    router = PrimaryReplicaRouter()
+
+    def test_reads_go_to_replica_when_configured(self):
+        with mock.patch.dict(settings.DATABASES, REPLICA):
+            self.assertEqual(self.router.db_for_read(PlayerSeasonStat), 'replica')
+
+    def test_reads_use_default_without_replica(self):
+        primary_only = {'default': settings.DATABASES['default']}
+        with mock.patch.dict(settings.DATABASES, primary_only, clear=True):
+            self.assertIsNone(self.router.db_for_read(PlayerSeasonStat))
+
+    def test_reads_stay_on_primary_inside_transaction(self):
+        with mock.patch.dict(settings.DATABASES, REPLICA), transaction.atomic():
+            self.assertIsNone(self.router.db_for_read(PlayerSeasonStat))
+
+    def test_writes_go_to_primary(self):
+        with mock.patch.dict(settings.DATABASES, REPLICA):
+            self.assertEqual(self.router.db_for_write(PlayerSeasonStat), 'default')
+
+
+class SaveStatsBatchTests(TransactionTestCase):
+
+    def test_writes_go_to_default_with_replica_configured(self):
+        records = [
+            {'Year': '2016', 'Team': 'Mumbai Indians', 'Player': 'Rohit sharma',
+             'Role': 'Batsman', 'Total Runs': '489', 'Total Fours': '43',
+             'Total Sixes': '23', 'Total Wickets': '-', 'Total Dots': '0',
+             'Total 50s': '3'},
+        ]
+        router = PrimaryReplicaRouter()
+        with mock.patch.dict(settings.DATABASES, REPLICA):
+            # reads would now go to the replica, writes must not
+            self.assertEqual(router.db_for_read(PlayerSeasonStat), 'replica')
+            with mock.patch.object(PrimaryReplicaRouter, 'db_for_read',
+                                   side_effect=AssertionError('unexpected read')), \
+                    CaptureQueriesContext(connections['default']) as queries:
+                save_stats_batch(records)
+        self.assertTrue(any(q['sql'].startswith('INSERT') for q in queries.captured_queries))
+        row = PlayerSeasonStat.objects.using('default').get(player='Rohit sharma')
+        self.assertEqual((row.total_runs, row.total_wickets), (489, 0))
+
+
+class MetricsSQLiteWrapper(db_metrics.MetricsWrapperMixin, sqlite_base.DatabaseWrapper):
+    pass
+
+
+class DbMetricsTests(SimpleTestCase):
+
+    def setUp(self):
+        db_metrics.reset()
+        self.addCleanup(db_metrics.reset)
+
+    def test_records_connect_and_query_timings(self):
+        settings_dict = dict(connections['default'].settings_dict, NAME=':memory:')
+        wrapper = MetricsSQLiteWrapper(settings_dict, alias='metrics_test')
+        try:
+            with wrapper.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                cursor.execute('SELECT 2')
+        finally:
+            wrapper.close()
+
+        m = db_metrics.snapshot()['metrics_test']
+        self.assertEqual(m['connections'], 1)
+        self.assertEqual(m['queries'], 2)
+        self.assertGreaterEqual(m['connect_seconds'], 0)
+        self.assertGreater(m['query_seconds'], 0)
+
+    def test_reset_clears_counters(self):
+        db_metrics.record_query('default', 0.5)
+        db_metrics.reset()
+        self.assertEqual(db_metrics.snapshot(), {})
+
+
+class PlayerSeasonStatAdminTests(TestCase):
+
+    url = '/admin/stats/playerseasonstat/'
+
+    def setUp(self):
+        _stat('Rohit sharma', year=2016).save()
+        _stat('Ishan kishan', year=2020).save()
+        _stat('Alex Carey', year=2020).save()
+        User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        self.client.login(username='admin', password='pw')
+
+    def test_filters_do_not_scan_for_distinct_values(self):
+        # first (cold) load: filter choices must not come from the table
+        with CaptureQueriesContext(connections['default']) as queries:
+            response = self.client.get(self.url, {'year': '2016', 'team': 'Mumbai Indians'})
+        self.assertContains(response, 'Rohit sharma')
+        self.assertNotContains(response, 'Ishan kishan')
+        self.assertContains(response, 'Royal Challengers Bangalore')  # static team choice
+        self.assertFalse(any('DISTINCT' in q['sql'] for q in queries.captured_queries))
+
+    def test_search_is_case_insensitive_and_matches_surnames(self):
+        for term, player in [('alex carey', 'Alex Carey'), ('carey', 'Alex Carey'),
+                             ('ROHIT', 'Rohit sharma')]:
+            response = self.client.get(self.url, {'q': term})
+            self.assertContains(response, player)
+            self.assertNotContains(response, 'Ishan kishan')
+
+
+class SimilarityTests(TestCase):
+
+    def setUp(self):
+        for i in range(12):
+            _stat(f'P{i}', year=2016 + i % 2, total_runs=10 * i, total_fours=i,
+                  total_sixes=i % 3, total_wickets=i % 4, total_dots=2 * i).save()
+        fd, self.path = tempfile.mkstemp(suffix='.pkl')
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def test_builds_season_and_career_indexes(self):
+        season = similarity.build_season_index()
+        self.assertEqual(len(season), 12)
+        self.assertIn(('P3', 'Mumbai Indians', 2017), season)
+        career = similarity.build_career_index()
+        self.assertEqual(len(career), 12)
+        self.assertIn(('P3',), career)
+
+    def test_empty_build_raises(self):
+        empty = PlayerSeasonStat.objects.none()
+        with self.assertRaises(ValueError):
+            similarity.build_season_index(empty)
+        with self.assertRaises(ValueError):
+            similarity.build_career_index(empty)
+        PlayerSeasonStat.objects.all().delete()
+        with self.assertRaises(CommandError):
+            call_command('similar_players', '--rebuild', '--index', self.path)
+
+    def test_similar_to_excludes_key_and_can_restrict_season(self):
+        index = similarity.build_season_index()
+        key = ('P4', 'Mumbai Indians', 2016)
+        hits = index.similar_to(key, k=3)
+        self.assertEqual(len(hits), 3)
+        self.assertNotIn(key, [other for other, _ in hits])
+
+        same_season = index.similar_to(key, k=10, year=2016)
+        self.assertEqual(len(same_season), 5)  # the other 2016 seasons
+        self.assertEqual({other[2] for other, _ in same_season}, {2016})
+
+    def test_add_replaces_existing_key_and_keeps_scaler(self):
+        index = similarity.build_season_index()
+        mean = index.scaler.mean_.copy()
+        key = ('P0', 'Mumbai Indians', 2016)
+        target = index.raw[index._positions[('P11', 'Mumbai Indians', 2017)]]
+        index.add([key, ('New', 'Mumbai Indians', 2018)], [target, target])
+
+        self.assertEqual(len(index), 13)
+        self.assertTrue((index.scaler.mean_ == mean).all())
+        nearest, dist = index.similar_to(key, k=1)[0]
+        self.assertAlmostEqual(dist, 0.0)
+        self.assertIn(nearest, [('P11', 'Mumbai Indians', 2017), ('New', 'Mumbai Indians', 2018)])
+
+    def test_save_load_round_trip(self):
+        for brute_force_max in (1000, 5):  # brute-force path, then KD-tree path
+            with mock.patch.object(similarity, 'BRUTE_FORCE_MAX', brute_force_max):
+                index = similarity.build_season_index()
+                self.assertEqual(index._tree is None, brute_force_max == 1000)
+                index.save(self.path)
+                loaded = similarity.SimilarityIndex.load(self.path)
+                self.assertEqual(loaded._tree is None, brute_force_max == 1000)
+                key = ('P5', 'Mumbai Indians', 2017)
+                self.assertEqual(loaded.keys, index.keys)
+                self.assertEqual(loaded.similar_to(key, k=4), index.similar_to(key, k=4))
+
+
+class ExportTests(TestCase):
+
+    def setUp(self):
+        for player, year, team, role in [
+            ('Rohit sharma', 2016, 'Mumbai Indians', 'Batsman'),
+            ('Jasprit bumrah', 2016, 'Mumbai Indians', 'Bowler'),
+            ('Ishan kishan', 2020, 'Mumbai Indians', 'Batsman'),
+            ('Virat kohli', 2016, 'Royal Challengers Bangalore', 'Batsman'),
+        ]:
+            stat = _stat(player, year=year)
+            stat.team, stat.role = team, role
+            stat.save()
+
+    def test_filtered_gzip_csv(self):
+        qs = export_queryset(start_year=2016, end_year=2016, team='Mumbai Indians', role='Batsman')
+        body = gzip.decompress(b''.join(stream_export(qs, 'csv', compress=True, chunk_size=1)))
+        lines = body.decode('utf-8').splitlines()
+        self.assertEqual(lines[0], ','.join(CSV_HEADERS))
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].startswith('2016,Mumbai Indians,Rohit sharma,Batsman,'))
+
+    def test_ndjson(self):
+        qs = export_queryset(start_year=2016, end_year=2016)
+        body = b''.join(stream_export(qs, 'ndjson', chunk_size=2)).decode('utf-8')
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(len(rows), 3)
+        self.assertEqual({r['year'] for r in rows}, {2016})
+
+    def test_view_requires_staff(self):
+        response = self.client.get('/stats/export/')
+        self.assertEqual(response.status_code, 302)
+
+        User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        self.client.login(username='admin', password='pw')
+        response = self.client.get('/stats/export/', {'team': 'Mumbai Indians', 'gzip': '1'})
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        lines = gzip.decompress(b''.join(response.streaming_content)).splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(self.client.get('/stats/export/', {'format': 'xml'}).status_code, 400)
+
+
+class ExportCursorTests(TransactionTestCase):
+
+    def test_rows_are_read_inside_a_transaction(self):
+        # Outside a transaction Django would declare the server-side cursor
+        # WITH HOLD, making PostgreSQL materialise every row up front.
+        for i in range(3):
+            _stat(f'P{i}').save()
+        for fmt, rows in (('csv', iter_csv), ('ndjson', iter_ndjson)):
+            qs = export_queryset().using('default')
+            conn = connections[qs.db]
+            self.assertFalse(conn.in_atomic_block)
+            chunks = rows(qs, chunk_size=1)
+            if fmt == 'csv':
+                next(chunks)  # header
+            next(chunks)
+            self.assertTrue(conn.in_atomic_block, fmt)
+            list(chunks)
+            self.assertFalse(conn.in_atomic_block, fmt)
+
+
+class ArchiveStatsTests(TestCase):
+
+    def setUp(self):
+        for player, year in [('Sachin tendulkar', 2010), ('Rohit sharma', 2016),
+                             ('Ishan kishan', 2020)]:
+            _stat(player, year=year).save()
+        fd, self.path = tempfile.mkstemp(suffix='.csv.gz')
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def _archived_lines(self):
+        with gzip.open(self.path, 'rt', encoding='utf-8') as fh:
+            return fh.read().splitlines()
+
+    def test_archive_without_delete_keeps_rows(self):
+        call_command('archive_stats', cutoff=2016, output=self.path, stdout=io.StringIO())
+        lines = self._archived_lines()
+        self.assertEqual(lines[0], ','.join(CSV_HEADERS))
+        self.assertEqual([line.split(',')[2] for line in lines[1:]],
+                         ['Sachin tendulkar', 'Rohit sharma'])
+        self.assertEqual(PlayerSeasonStat.objects.count(), 3)
+
+    def test_archive_with_delete_removes_only_archived_rows(self):
+        with mock.patch.object(PrimaryReplicaRouter, 'db_for_read', return_value='replica'):
+            # the archive must not follow routed reads to a replica
+            call_command('archive_stats', cutoff=2016, output=self.path, delete=True,
+                         stdout=io.StringIO())
+        self.assertEqual(len(self._archived_lines()), 3)
+        self.assertEqual(list(PlayerSeasonStat.objects.values_list('player', flat=True)),
+                         ['Ishan kishan'])
+
+
+class CliStartupTests(SimpleTestCase):
+
+    def test_parser_builds_without_heavy_imports_within_budget(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        probe = (
+            "import sys, time; start = time.perf_counter(); "
+            "import cli; cli.build_parser(); "
+            "elapsed = time.perf_counter() - start; "
+            "heavy = [m for m in ('django', 'pandas', 'selenium', 'sklearn') if m in sys.modules]; "
+            "print(','.join(heavy)); print(elapsed); print(cli.STARTUP_BUDGET_SECONDS)"
+        )
+        env = {k: v for k, v in os.environ.items() if k != 'DJANGO_SETTINGS_MODULE'}
+        out = subprocess.run([sys.executable, '-c', probe], cwd=root, env=env,
+                             capture_output=True, text=True, check=True).stdout.splitlines()
+        heavy, elapsed, budget = out[0], float(out[1]), float(out[2])
+        self.assertEqual(heavy, '')
+        self.assertLess(elapsed, budget)
@@ -1,14 +1,19 @@
 # stats/utils.py
 
-from django.db import connection, transaction
+from django.db import connections, router, transaction
 from .models import PlayerSeasonStat
 
-def ensure_playerseasonstat_table():
+def ensure_playerseasonstat_table(using='default'):
     """
-    Ensures the stats_playerseasonstat table (and an index) exist.
-    Uses raw SQL to create them if missing.
+    Ensures the stats_playerseasonstat table (and its indexes) exist.
+    Uses raw SQL to create them if missing. The SQL is PostgreSQL-only;
+    other backends rely on migrations.
     """
-    with connection.cursor() as cursor:
+    if connections[using].vendor != 'postgresql':
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute("SELECT to_regclass('stats_playerseasonstat');")
+        bootstrapping = cursor.fetchone()[0] is None
         cursor.execute("""
         CREATE TABLE IF NOT EXISTS stats_playerseasonstat (
             id              SERIAL PRIMARY KEY,
@@ -22,13 +27,50 @@ def ensure_playerseasonstat_table():
             total_wickets   INTEGER         NOT NULL,
             total_dots      INTEGER         NOT NULL,
             total_fifties   INTEGER         NOT NULL,
+            boundary_pct      DOUBLE PRECISION NULL,
+            dots_per_wicket   DOUBLE PRECISION NULL,
+            runs_per_boundary DOUBLE PRECISION NULL,
             UNIQUE (year, team, player)
         );
         """)
+        if bootstrapping:
+            # Migrated databases get these from migrations under Django's
+            # own index names; only add them to raw-SQL tables, otherwise
+            # every insert would maintain a duplicate index.
+            cursor.execute("""
+            CREATE INDEX IF NOT EXISTS stats_year_team_idx
+              ON stats_playerseasonstat (year, team);
+            """)
+            cursor.execute("""
+            CREATE INDEX IF NOT EXISTS stats_role_idx
+              ON stats_playerseasonstat (role);
+            """)
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+            cursor.execute("""
+            CREATE INDEX IF NOT EXISTS stats_player_upper_trgm_idx
+              ON stats_playerseasonstat USING gin (UPPER(player::text) gin_trgm_ops);
+            """)
+        # derived-metric columns for tables created before they existed.
+        # ALTER TABLE takes an ACCESS EXCLUSIVE lock even with IF NOT EXISTS,
+        # so only issue it for columns that are actually missing.
         cursor.execute("""
-        CREATE INDEX IF NOT EXISTS stats_year_team_idx
-          ON stats_playerseasonstat (year, team);
+        SELECT column_name FROM information_schema.columns
+         WHERE table_schema = current_schema()
+           AND table_name = 'stats_playerseasonstat';
         """)
+        existing = {row[0] for row in cursor.fetchall()}
+        for column in PlayerSeasonStat.DERIVED_METRICS:
+            if column not in existing:
+                cursor.execute(f"""
+                ALTER TABLE stats_playerseasonstat
+                  ADD COLUMN {column} DOUBLE PRECISION NULL;
+                """)
+            elif not bootstrapping:
+                continue
+            cursor.execute(f"""
+            CREATE INDEX IF NOT EXISTS stats_{column}_idx
+              ON stats_playerseasonstat ({column});
+            """)
 
 def _to_int(value):
     """
@@ -46,16 +88,21 @@ def save_stats_batch(records):
     Persist a batch of scraped IPL player-season statistics.
 
     1. Ensures the target table exists.
-    2. Converts each record’s fields into a PlayerSeasonStat instance.
+    2. Converts each record’s fields into a PlayerSeasonStat instance
+       and computes its derived ratio columns.
     3. Bulk-inserts with ignore_conflicts to skip duplicates.
+
+    All statements go to the write database (the primary), never a replica.
     """
+    db = router.db_for_write(PlayerSeasonStat)
+
     # 1) ensure table & index exist
-    ensure_playerseasonstat_table()
+    ensure_playerseasonstat_table(using=db)
 
     # 2) build model instances
     objs = []
     for rec in records:
-        objs.append(PlayerSeasonStat(
+        obj = PlayerSeasonStat(
             year         = _to_int(rec.get('Year')),
             team         = str(rec.get('Team', '')).strip(),
             player       = str(rec.get('Player', '')).strip(),
@@ -66,12 +113,28 @@ def save_stats_batch(records):
             total_wickets= _to_int(rec.get('Total Wickets')),
             total_dots   = _to_int(rec.get('Total Dots')),
             total_fifties= _to_int(rec.get('Total 50s')),
-        ))
+        )
+        obj.compute_derived()
+        objs.append(obj)
 
     # 3) bulk-insert
-    with transaction.atomic():
-        PlayerSeasonStat.objects.bulk_create(
+    with transaction.atomic(using=db):
+        PlayerSeasonStat.objects.using(db).bulk_create(
             objs,
             batch_size=500,
             ignore_conflicts=True  # requires Django ≥2.2
         )
+
+def ratio_leaderboard(metric, year=None, limit=10):
+    """
+    Top players by a stored derived metric (see PlayerSeasonStat.DERIVED_METRICS).
+
+    Rows with a NULL ratio are excluded so the ordered scan can run
+    straight off the metric's index instead of sorting the whole table.
+    """
+    if metric not in PlayerSeasonStat.DERIVED_METRICS:
+        raise ValueError(f"Unknown metric {metric!r}")
+    qs = PlayerSeasonStat.objects.filter(**{f'{metric}__isnull': False})
+    if year is not None:
+        qs = qs.filter(year=year)
+    return qs.order_by(f'-{metric}')[:limit]
@@ -1,3 +1,42 @@
-from django.shortcuts import render
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpResponseBadRequest, StreamingHttpResponse
+from django.views.decorators.http import require_GET
 
-# Create your views here.
+from .export import FORMATS, export_queryset, stream_export
+
+CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+@staff_member_required
+@require_GET
+def export_stats(request):
+    """
+    Stream PlayerSeasonStat rows as CSV or NDJSON.
+
+    Staff only: each download holds a connection and a server-side
+    cursor for as long as the client keeps reading.
+
+    Query parameters: format (csv|ndjson), start_year, end_year, team,
+    role, gzip (1 to compress on the fly).
+    """
+    fmt = request.GET.get('format', 'csv')
+    if fmt not in FORMATS:
+        return HttpResponseBadRequest(f"format must be one of {', '.join(FORMATS)}")
+    try:
+        start_year = int(request.GET['start_year']) if request.GET.get('start_year') else None
+        end_year = int(request.GET['end_year']) if request.GET.get('end_year') else None
+    except ValueError:
+        return HttpResponseBadRequest("start_year and end_year must be integers")
+    compress = request.GET.get('gzip') == '1'
+
+    qs = export_queryset(start_year, end_year,
+                         request.GET.get('team'), request.GET.get('role'))
+    response = StreamingHttpResponse(
+        stream_export(qs, fmt, compress),
+        content_type='application/gzip' if compress else CONTENT_TYPES[fmt],
+    )
+    filename = f"ipl_stats.{fmt}" + ('.gz' if compress else '')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response